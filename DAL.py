@@ -1,5 +1,14 @@
 import sqlite3
 import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Dedicated, bounded pool for SQLite work so async views never block the event loop
+# and a burst of slow writes can't spawn an unbounded number of threads.
+DB_MAX_WORKERS = int(os.environ.get('DB_MAX_WORKERS', '4'))
+_db_executor = ThreadPoolExecutor(max_workers=DB_MAX_WORKERS, thread_name_prefix='dal')
 
 
 def init_db(db_path="projects.db"):
@@ -86,3 +95,47 @@ def insert_project(title, description, image_file_name, db_path="projects.db"):
     conn.close()
     
     return project_id
+
+
+async def _run_in_db_executor(func, *args):
+    """
+    Run a blocking DAL function on the dedicated database executor.
+    
+    Args:
+        func (callable): Synchronous DAL function to call
+        *args: Positional arguments passed through to func
+        
+    Returns:
+        Whatever func returns
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_db_executor, functools.partial(func, *args))
+
+
+async def get_all_projects_async(db_path="projects.db"):
+    """
+    Async variant of get_all_projects that runs the query on the database executor.
+    
+    Args:
+        db_path (str): Path to the SQLite database file
+        
+    Returns:
+        list: List of project rows as dicts
+    """
+    return await _run_in_db_executor(get_all_projects, db_path)
+
+
+async def insert_project_async(title, description, image_file_name, db_path="projects.db"):
+    """
+    Async variant of insert_project that runs the insert on the database executor.
+    
+    Args:
+        title (str): Project title
+        description (str): Project description
+        image_file_name (str): Name of the image file
+        db_path (str): Path to the SQLite database file
+        
+    Returns:
+        int: ID of the inserted project
+    """
+    return await _run_in_db_executor(insert_project, title, description, image_file_name, db_path)
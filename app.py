@@ -1,11 +1,17 @@
 # IMPORTANT: Professor requires deletion of .venv folder before submission
 # Please delete the .venv folder and include requirements.txt file
 
-from flask import Flask, render_template, request, redirect, url_for
+from flask import Flask, render_template, request, redirect, url_for, before_render_template
+from markupsafe import Markup
 from DAL import init_db, get_all_projects, insert_project
+from critical_css import get_critical_css
 import os
 
 
+FONTS_URL = 'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap'
+FONTS_ORIGIN = 'https://fonts.gstatic.com'
+
+
 def create_app():
     """Application factory pattern for better testing support."""
     app = Flask(__name__)
@@ -18,6 +24,28 @@ def create_app():
     
     # Store db_path in app config for use in routes
     app.config['DATABASE_PATH'] = db_path
+    app.config['FONTS_URL'] = FONTS_URL
+    
+    def expose_page_template(sender, template, context, **extra):
+        # Lets shared partials like _head_styles.html know which page is being rendered
+        context.setdefault('page_template', template.name)
+
+    before_render_template.connect(expose_page_template, app, weak=False)
+
+    @app.template_global()
+    def critical_css(template_name):
+        # Inlined into <style>, so it must not be HTML-escaped
+        return Markup(get_critical_css(template_name))
+
+    @app.after_request
+    def add_preload_headers(response):
+        # Let the browser start fetching the stylesheet and fonts before it parses the HTML
+        if response.status_code == 200 and response.mimetype == 'text/html':
+            stylesheet = url_for('static', filename='css/styles.css')
+            response.headers.add('Link', f'<{stylesheet}>; rel=preload; as=style')
+            response.headers.add('Link', f'<{app.config["FONTS_URL"]}>; rel=preload; as=style')
+            response.headers.add('Link', f'<{FONTS_ORIGIN}>; rel=preconnect; crossorigin')
+        return response
     
     @app.route("/")
     def index():
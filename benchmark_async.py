@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark script comparing concurrent-client throughput of the sync and async request paths.
+Both apps are served over real HTTP by a threaded Werkzeug server and hit by N concurrent clients.
+
+The async views only run with Flask's async extra installed (pip install "flask[async]").
+The app itself keeps sync views: under WSGI each async view gets its own event loop on the
+request thread, so clients are not multiplexed and throughput drops. The views should move
+to the async DAL once the app runs on an ASGI stack.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import logging
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import render_template, request, redirect, url_for
+from werkzeug.serving import make_server
+
+from DAL import insert_project, get_all_projects_async, insert_project_async
+
+
+def create_sync_app(db_path):
+    """Build the real application (sync views) against the given database."""
+    previous = os.environ.get('DATABASE_PATH')
+    os.environ['DATABASE_PATH'] = db_path
+    try:
+        from app import create_app
+        return create_app()
+    finally:
+        if previous is None:
+            del os.environ['DATABASE_PATH']
+        else:
+            os.environ['DATABASE_PATH'] = previous
+
+
+def create_async_app(db_path):
+    """Build the application with /projects and /add awaiting the async DAL variants."""
+    app = create_sync_app(db_path)
+
+    # Same bodies as the views in app.py, with only the DAL calls swapped for their async variants
+    async def projects():
+        db_path = app.config['DATABASE_PATH']
+        projects = await get_all_projects_async(db_path)
+        return render_template("projects.html", projects=projects)
+
+    async def add_project():
+        if request.method == "POST":
+            title = request.form.get("title")
+            description = request.form.get("description")
+            image_file_name = request.form.get("image_file_name")
+
+            if title and description and image_file_name:
+                db_path = app.config['DATABASE_PATH']
+                await insert_project_async(title, description, image_file_name, db_path)
+                return redirect(url_for("projects"))
+
+        return render_template("add.html")
+
+    app.view_functions['projects'] = projects
+    app.view_functions['add_project'] = add_project
+    return app
+
+
+def seed(db_path, count):
+    """Insert count projects so /projects has a realistic amount of work to do."""
+    for i in range(count):
+        insert_project(f'Benchmark Project {i}', f'Description {i}', f'bench_{i}.jpg', db_path)
+
+
+def run_clients(base_url, clients, requests_per_client):
+    """Hit the server from concurrent clients with a 9:1 read/write mix and return req/s."""
+    def client(n):
+        for i in range(requests_per_client):
+            if i % 10 == 9:
+                data = f'title=c{n}r{i}&description=bench&image_file_name=b.jpg'.encode()
+                urllib.request.urlopen(f'{base_url}/add', data=data).read()
+            else:
+                urllib.request.urlopen(f'{base_url}/projects').read()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(client, range(clients)))
+    elapsed = time.perf_counter() - start
+    return clients * requests_per_client / elapsed
+
+
+def benchmark(label, factory, clients, requests_per_client, seed_count):
+    """Serve the app built by factory on an ephemeral port and report its throughput."""
+    db_fd, db_path = tempfile.mkstemp()
+    try:
+        app = factory(db_path)
+        seed(db_path, seed_count)
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            rps = run_clients(f'http://127.0.0.1:{server.server_port}', clients, requests_per_client)
+        finally:
+            server.shutdown()
+        print(f"{label:<6} {clients:>4} clients  {rps:>10.1f} req/s")
+        return rps
+    finally:
+        os.close(db_fd)
+        os.unlink(db_path)
+
+
+if __name__ == "__main__":
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    requests_per_client = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    seed_count = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    print("Concurrent-client throughput: sync vs async request path")
+    print("=" * 50)
+    sync_rps = benchmark('sync', create_sync_app, clients, requests_per_client, seed_count)
+    async_rps = benchmark('async', create_async_app, clients, requests_per_client, seed_count)
+    print("=" * 50)
+    print(f"async/sync ratio: {async_rps / sync_rps:.2f}x")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark script estimating first paint per page before and after critical-CSS inlining.
+Each page is rendered through the app, then the bytes and round trips that block rendering are
+counted and converted to a time using Lighthouse's simulated mobile network (150 ms RTT, 1.6 Mbps).
+
+Before: the HTML plus styles.css and the Google Fonts stylesheet, all render-blocking.
+After:  the HTML with critical CSS inlined; both stylesheets load without blocking the first paint.
+"""
+import os
+import re
+import tempfile
+
+from critical_css import STYLESHEET_PATH
+
+
+RTT_MS = 150
+BANDWIDTH_BYTES_PER_MS = 1.6 * 1024 * 1024 / 8 / 1000
+# The fonts stylesheet is fetched from another origin: DNS + TCP + TLS before the request itself
+CROSS_ORIGIN_SETUP_RTTS = 3
+# Size of the Google Fonts CSS response for the Inter family (not fetched, to keep the run offline)
+FONTS_CSS_BYTES = 1500
+
+PAGES = ['/', '/about', '/resume', '/projects', '/contact', '/thankyou', '/add']
+
+
+def fetch_ms(num_bytes, rtts=1):
+    """Time to fetch a resource of num_bytes after the given number of round trips."""
+    return rtts * RTT_MS + num_bytes / BANDWIDTH_BYTES_PER_MS
+
+
+def first_paint_before(html_bytes, css_bytes):
+    """Estimate first paint when both stylesheets block rendering."""
+    stylesheet = fetch_ms(css_bytes)
+    fonts = fetch_ms(FONTS_CSS_BYTES, rtts=CROSS_ORIGIN_SETUP_RTTS + 1)
+    return fetch_ms(html_bytes) + max(stylesheet, fonts)
+
+
+def first_paint_after(html_bytes):
+    """Estimate first paint when only the HTML (with inlined critical CSS) blocks rendering."""
+    return fetch_ms(html_bytes)
+
+
+def render_pages():
+    """Render every page through the app and return {path: html}."""
+    db_fd, db_path = tempfile.mkstemp()
+    previous = os.environ.get('DATABASE_PATH')
+    os.environ['DATABASE_PATH'] = db_path
+    try:
+        from app import create_app
+        client = create_app().test_client()
+        return {path: client.get(path).get_data(as_text=True) for path in PAGES}
+    finally:
+        if previous is None:
+            del os.environ['DATABASE_PATH']
+        else:
+            os.environ['DATABASE_PATH'] = previous
+        os.close(db_fd)
+        os.unlink(db_path)
+
+
+if __name__ == "__main__":
+    css_bytes = os.path.getsize(STYLESHEET_PATH)
+
+    print("Estimated first paint: blocking stylesheets vs inlined critical CSS")
+    print("=" * 72)
+    print(f"{'page':<11} {'blocking KB before':>18} {'after':>7} {'ms before':>10} {'after':>7} {'saved':>7}")
+    total_before = total_after = 0
+    for path, html in render_pages().items():
+        after_html = len(html.encode())
+        before_html = len(re.sub(r'<style>.*?</style>', '', html, flags=re.DOTALL).encode())
+        before_ms = first_paint_before(before_html, css_bytes)
+        after_ms = first_paint_after(after_html)
+        total_before += before_ms
+        total_after += after_ms
+        blocking_before = (before_html + css_bytes + FONTS_CSS_BYTES) / 1024
+        print(f"{path:<11} {blocking_before:>18.1f} {after_html / 1024:>7.1f} "
+              f"{before_ms:>10.0f} {after_ms:>7.0f} {before_ms - after_ms:>7.0f}")
+    print("=" * 72)
+    print(f"average first paint: {total_before / len(PAGES):.0f} ms -> {total_after / len(PAGES):.0f} ms")
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Critical-CSS extraction for the site templates.
+Finds the stylesheet rules needed to paint the above-the-fold part of each template so they
+can be inlined into the page while the full stylesheet loads asynchronously.
+
+Run as a script to pre-build the extracted CSS into static/css/critical/.
+"""
+import os
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_DIR = os.path.join(BASE_DIR, 'templates')
+STYLESHEET_PATH = os.path.join(BASE_DIR, 'static', 'css', 'styles.css')
+CRITICAL_DIR = os.path.join(BASE_DIR, 'static', 'css', 'critical')
+
+# Number of top-level <section> blocks inside <main> treated as above the fold.
+# Page headers are short, so the start of the following section is usually visible too.
+FOLD_SECTIONS = 2
+
+# Selectors that always apply to the first paint regardless of markup
+ALWAYS_CRITICAL = {'*', 'html', 'body', ':root'}
+
+# Elements that never have a closing tag, so they must not affect nesting depth
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'wbr'}
+
+
+class _AboveFoldCollector(HTMLParser):
+    """Collect tag names, classes and ids used before the fold of a template."""
+
+    def __init__(self):
+        super().__init__()
+        self.tags = {'html', 'body'}
+        self.classes = set()
+        self.ids = set()
+        self.in_main = False
+        self.main_depth = 0
+        self.depth = 0
+        self.sections_closed = 0
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag not in VOID_ELEMENTS:
+            self.depth += 1
+        if tag == 'main':
+            self.in_main = True
+            self.main_depth = self.depth
+        self.tags.add(tag)
+        for name, value in attrs:
+            if name == 'class' and value:
+                self.classes.update(value.split())
+            elif name == 'id' and value:
+                self.ids.add(value)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and not self.done:
+            self.depth -= 1
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        if self.in_main and tag == 'section' and self.depth == self.main_depth + 1:
+            self.sections_closed += 1
+            if self.sections_closed >= FOLD_SECTIONS:
+                self.done = True
+        if tag == 'main':
+            self.done = True
+        self.depth -= 1
+
+
+def collect_above_fold(template_path):
+    """
+    Collect the tags, classes and ids a template uses above the fold.
+
+    Args:
+        template_path (str): Path to the Jinja template
+
+    Returns:
+        tuple: (tags, classes, ids) as sets of strings
+    """
+    with open(template_path, encoding='utf-8') as f:
+        source = f.read()
+    collector = _AboveFoldCollector()
+    collector.feed(source)
+    return collector.tags, collector.classes, collector.ids
+
+
+def _split_blocks(css):
+    """Split CSS text into top-level (prelude, body) pairs, respecting nested braces."""
+    blocks = []
+    depth = 0
+    start = 0
+    prelude = ''
+    for i, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                prelude = css[start:i].strip()
+                start = i + 1
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[start:i]))
+                start = i + 1
+    return blocks
+
+
+def _selector_is_critical(selector, tags, classes, ids):
+    """Check whether the subject of a single selector can match an above-the-fold element."""
+    selector = selector.strip()
+    if selector in ALWAYS_CRITICAL:
+        return True
+    # Only the rightmost compound decides what gets styled; ancestors are not checked,
+    # which over-includes a little but never drops a needed rule.
+    subject = re.split(r'[\s>+~]+', selector)[-1]
+    subject = re.sub(r'::?[\w-]+(\([^)]*\))?', '', subject)
+    subject = re.sub(r'\[[^\]]*\]', '', subject)
+    if not subject or subject == '*':
+        return True
+
+    tag = re.match(r'^[a-zA-Z][\w-]*', subject)
+    if tag and tag.group(0).lower() not in tags:
+        return False
+    if any(name not in classes for name in re.findall(r'\.([\w-]+)', subject)):
+        return False
+    if any(name not in ids for name in re.findall(r'#([\w-]+)', subject)):
+        return False
+    return True
+
+
+def _filter_rules(css, tags, classes, ids):
+    """Return the subset of css whose rules apply above the fold."""
+    kept = []
+    for prelude, body in _split_blocks(css):
+        if prelude.startswith('@media'):
+            inner = _filter_rules(body, tags, classes, ids)
+            if inner:
+                kept.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@'):
+            # @keyframes and friends are not needed for the first paint
+            continue
+        elif any(_selector_is_critical(s, tags, classes, ids) for s in prelude.split(',')):
+            declarations = ';'.join(d.strip() for d in body.split(';') if d.strip())
+            kept.append(f'{prelude}{{{declarations}}}')
+    return ''.join(kept)
+
+
+def extract_critical_css(template_path, css_path=STYLESHEET_PATH):
+    """
+    Extract the critical above-the-fold CSS rules for a template.
+
+    Args:
+        template_path (str): Path to the Jinja template
+        css_path (str): Path to the full stylesheet
+
+    Returns:
+        str: Minified CSS containing only the rules needed for the first paint
+    """
+    with open(css_path, encoding='utf-8') as f:
+        css = f.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    tags, classes, ids = collect_above_fold(template_path)
+    return _filter_rules(css, tags, classes, ids)
+
+
+@lru_cache(maxsize=None)
+def _cached_critical_css(template_name, template_mtime, css_mtime):
+    """Load pre-built critical CSS for a template, extracting it if the build is missing or stale."""
+    built_path = os.path.join(CRITICAL_DIR, template_name.replace('.html', '.css'))
+    if os.path.exists(built_path) and os.path.getmtime(built_path) >= max(template_mtime, css_mtime):
+        with open(built_path, encoding='utf-8') as f:
+            return f.read()
+    return extract_critical_css(os.path.join(TEMPLATES_DIR, template_name))
+
+
+def get_critical_css(template_name):
+    """
+    Get the critical CSS for a template, cached per template and source modification time.
+
+    Args:
+        template_name (str): Template file name, e.g. "index.html"
+
+    Returns:
+        str: Critical CSS for the template, or an empty string if the template or stylesheet is missing
+    """
+    try:
+        template_mtime = os.path.getmtime(os.path.join(TEMPLATES_DIR, template_name))
+        css_mtime = os.path.getmtime(STYLESHEET_PATH)
+    except OSError:
+        # The full stylesheet still loads, so the page renders without the inlined rules
+        return ''
+    return _cached_critical_css(template_name, template_mtime, css_mtime)
+
+
+def build_all():
+    """Extract and write critical CSS for every template under templates/."""
+    os.makedirs(CRITICAL_DIR, exist_ok=True)
+    for template_name in sorted(os.listdir(TEMPLATES_DIR)):
+        if not template_name.endswith('.html') or template_name.startswith('_'):
+            continue
+        critical = extract_critical_css(os.path.join(TEMPLATES_DIR, template_name))
+        out_path = os.path.join(CRITICAL_DIR, template_name.replace('.html', '.css'))
+        with open(out_path, 'w', encoding='utf-8') as f:
+            f.write(critical)
+        print(f"{template_name:<16} {len(critical):>6} bytes critical CSS")
+
+
+if __name__ == "__main__":
+    build_all()
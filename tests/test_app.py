@@ -3,8 +3,15 @@ Test cases for Flask application routes and functionality.
 """
 import pytest
 import json
+import asyncio
+import os
+import threading
 from flask import url_for
 
+import DAL
+from DAL import get_all_projects_async, insert_project_async, DB_MAX_WORKERS
+from critical_css import extract_critical_css, get_critical_css, TEMPLATES_DIR
+
 
 class TestRoutes:
     """Test all Flask routes."""
@@ -152,3 +159,106 @@ class TestTemplateRendering:
             assert b'<!DOCTYPE html>' in response.data
             assert b'<html' in response.data
             assert b'</html>' in response.data
+
+
+class TestAsyncDAL:
+    """Test the async DAL variants that run on the database executor."""
+    
+    def test_insert_and_get_projects_async(self, app):
+        """Test async insert followed by async read returns the new project."""
+        db_path = app.config['DATABASE']
+        project_id = asyncio.run(
+            insert_project_async('Async Project', 'Inserted via executor', 'async.jpg', db_path)
+        )
+        projects = asyncio.run(get_all_projects_async(db_path))
+        
+        assert project_id == 1
+        assert [p['title'] for p in projects] == ['Async Project']
+    
+    def test_concurrent_async_reads(self, populated_db):
+        """Test many concurrent async reads all see the same data."""
+        async def read_many():
+            return await asyncio.gather(*(get_all_projects_async(populated_db) for _ in range(20)))
+        
+        results = asyncio.run(read_many())
+        assert len(results) == 20
+        assert all(len(projects) == 2 for projects in results)
+    
+    def test_db_executor_is_bounded(self, populated_db, monkeypatch):
+        """Test concurrent async calls never run more than DB_MAX_WORKERS queries at once."""
+        assert DAL._db_executor._max_workers == DB_MAX_WORKERS
+        
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+        original = DAL.get_all_projects
+        
+        def tracked_get_all_projects(db_path):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                return original(db_path)
+            finally:
+                with lock:
+                    active -= 1
+        
+        monkeypatch.setattr(DAL, 'get_all_projects', tracked_get_all_projects)
+        
+        async def read_many():
+            return await asyncio.gather(*(get_all_projects_async(populated_db) for _ in range(50)))
+        
+        asyncio.run(read_many())
+        assert 1 <= peak <= DB_MAX_WORKERS
+
+
+class TestCriticalCSS:
+    """Test critical-CSS inlining and preload hints."""
+    
+    def test_critical_css_inlined(self, client):
+        """Test pages inline critical CSS and load the full stylesheet asynchronously."""
+        response = client.get('/')
+        assert response.status_code == 200
+        assert b'<style>*{' in response.data
+        assert b'.navbar{' in response.data
+        assert b'rel="preload" href="/static/css/styles.css" as="style"' in response.data
+    
+    def test_critical_css_excludes_below_fold_rules(self):
+        """Test rules for classes only used below the fold are left out."""
+        critical = extract_critical_css(os.path.join(TEMPLATES_DIR, 'index.html'))
+        assert '.hero{' in critical
+        assert '.footer-bottom{' not in critical
+    
+    def test_preload_link_headers(self, client):
+        """Test HTML responses carry Link preload headers for the stylesheet and fonts."""
+        response = client.get('/about')
+        links = response.headers.getlist('Link')
+        assert '</static/css/styles.css>; rel=preload; as=style' in links
+        assert any('fonts.googleapis.com' in link for link in links)
+    
+    def test_each_page_inlines_its_own_critical_css(self, client):
+        """Test the shared head partial inlines the CSS of the template being rendered."""
+        assert b'.hero-buttons{' in client.get('/').data
+        assert b'.hero-buttons{' not in client.get('/about').data
+    
+    def test_unknown_template_has_no_critical_css(self):
+        """Test an unknown template name fails soft instead of raising."""
+        assert get_critical_css('missing.html') == ''
+    
+    def test_no_preload_headers_on_redirect(self, client):
+        """Test redirects don't get preload headers."""
+        project_data = {
+            'title': 'Redirect Project',
+            'description': 'Redirects back to projects',
+            'image_file_name': 'redirect.jpg'
+        }
+        
+        response = client.post('/add', data=project_data)
+        assert response.status_code == 302
+        assert 'Link' not in response.headers
+    
+    def test_no_preload_headers_on_static_files(self, client):
+        """Test non-HTML responses don't get preload headers."""
+        response = client.get('/static/css/styles.css')
+        assert 'Link' not in response.headers